@@ -1,193 +1,158 @@
-import pandas as pd
 import numpy as np
+from .srf_data import SRFData
+
+# Sensor name -> (SRF key, SRF band columns, band wave centers, wavelength range)
+SENSORS = {
+    'olci': ('s3', list(range(1, 20)),
+             [400, 412, 442, 490, 510, 560, 620, 665, 673, 681,
+              708, 753, 761, 764, 767, 778, 865, 885, 900], (400, 900)),
+    'msi_s2a': ('s2a', list(range(1, 10)),
+                [440, 490, 560, 665, 705, 740, 783, 842, 865], (400, 900)),
+    'msi_s2b': ('s2b', list(range(1, 10)),
+                [440, 490, 560, 665, 705, 740, 783, 842, 865], (400, 900)),
+    'oli': ('l8', list(range(1, 6)), [440, 490, 560, 665, 865], None),
+    'etm': ('l7', list(range(1, 5)), [490, 560, 665, 865], None),
+    'tm': ('l5', list(range(1, 5)), [490, 560, 665, 865], None),
+    'superdove': ('planet', list(range(1, 9)),
+                  [443, 490, 531, 565, 610, 665, 705, 865], (400, 900)),
+    'modis': ('modis', list(range(1, 17)),
+              [412, 443, 469, 488, 531, 551, 555, 645, 667, 678,
+               748, 859, 869, 1240, 1640, 2130], (400, 900))
+}
 
 class SatelliteBandSimulator:
-    def __init__(self, data_folder='../data-raw'):
-        self.srf_data = {
-            's3': pd.read_pickle(f"{data_folder}/s3_srf.pkl"),
-            's2a': pd.read_pickle(f"{data_folder}/s2_srf.pkl"),
-            's2b': pd.read_pickle(f"{data_folder}/s2b_srf.pkl"),
-            'l8': pd.read_pickle(f"{data_folder}/l8_srf.pkl"),
-            'l7': pd.read_pickle(f"{data_folder}/l7_srf.pkl"),
-            'l5': pd.read_pickle(f"{data_folder}/l5_srf.pkl"),
-            'planet': pd.read_pickle(f"{data_folder}/planet_srf.pkl"),
-            'modis': pd.read_pickle(f"{data_folder}/modis_srf.pkl")
-        }
-
-    def _simulate_bands_direct_optimized(self, spectra, srf_data, band_indices, wave_centers, point_names, wavelength_range=None):
-        # Convert to numpy for faster operations
-        spectra_values = spectra.values
-        spectra_wavelengths = spectra.index.values
-        
+    def __init__(self, data_folder=None):
+        # SRF tables are read on first use; by default from the bundled package data
+        self.srf_data = SRFData(data_folder)
+
+    def simulate(self, sensor, spectra_values, spectra_wavelengths):
+        # NumPy-only entry point: spectra_values has one row per wavelength and
+        # one column per point, and the result has one row per band. A single
+        # 1-D spectrum gives one value per band
+        srf_key, band_indices, _, wavelength_range = SENSORS[sensor]
+        spectra_values = np.asarray(spectra_values)
+        spectra_wavelengths = np.asarray(spectra_wavelengths)
+
+        if spectra_values.ndim not in (1, 2):
+            raise ValueError(f"spectra_values must be 1-D or 2-D, got {spectra_values.ndim}-D")
+        if spectra_wavelengths.ndim != 1 or len(spectra_wavelengths) != len(spectra_values):
+            raise ValueError("spectra_wavelengths must have one value per row of spectra_values")
+
+        results = self._simulate_bands_array(
+            spectra_values if spectra_values.ndim == 2 else spectra_values[:, np.newaxis], spectra_wavelengths,
+            self.srf_data.get_array(srf_key), band_indices, wavelength_range
+        )
+
+        if spectra_values.ndim == 1:
+            return results[:, 0]
+        return results
+
+    def _simulate_bands_array(self, spectra_values, spectra_wavelengths, srf_array, band_indices, wavelength_range=None):
         # Initialize result array with NaN
         n_bands = len(band_indices)
-        n_points = len(point_names)
+        n_points = spectra_values.shape[1]
         results = np.full((n_bands, n_points), np.nan)
-        
+
+        # Position of the first occurrence of each spectra wavelength
+        unique_wavelengths, first_indices = np.unique(spectra_wavelengths, return_index=True)
+        if len(unique_wavelengths) == 0:
+            return results
+
+        srf_wavelengths_raw = srf_array[:, 0]
+
         # Process each band
         for band_idx, srf_col_idx in enumerate(band_indices):
-            try:
-                # Extract SRF for this band
-                srf_wavelengths_raw = srf_data.iloc[:, 0].values
-                srf_values_raw = srf_data.iloc[:, srf_col_idx].values
-                
-                # Filter out NaN values
-                valid_mask = ~(pd.isna(srf_wavelengths_raw) | pd.isna(srf_values_raw))
-                srf_wavelengths = srf_wavelengths_raw[valid_mask].astype(int)
-                srf_values = srf_values_raw[valid_mask]
-
-                # Apply wavelength filtering
-                if wavelength_range is not None:
-                    min_wave, max_wave = wavelength_range
-                    mask = (srf_wavelengths >= min_wave) & (srf_wavelengths <= max_wave)
-                    srf_wavelengths = srf_wavelengths[mask]
-                    srf_values = srf_values[mask]
-
-                # Check if we have valid SRF data
-                if len(srf_values) == 0:
-                    continue
-
-                # Calculate FAC (normalization)
-                srf_sum = np.sum(srf_values)
-                if srf_sum <= 0:
-                    continue
-                
-                # Apply proper normalization - divide by sum and multiply by wavelength interval
-                fac_values = srf_values / srf_sum
-
-                # Find matching wavelengths between spectra and SRF
-                valid_indices = []
-                valid_fac = []
-
-                for i, wl in enumerate(srf_wavelengths):
-                    # Check if wavelength exists in spectra
-                    spec_idx_matches = np.where(spectra_wavelengths == wl)[0]
-                    if len(spec_idx_matches) > 0:
-                        spec_idx = spec_idx_matches[0]
-                        valid_indices.append(spec_idx)
-                        valid_fac.append(fac_values[i])
-                
-                if not valid_indices:
-                    continue
-                    
-                valid_indices = np.array(valid_indices)
-                valid_fac = np.array(valid_fac)
-
-                # Process each point individually to handle invalid data
-                for point_idx in range(n_points):
-                    try:
-                        # Get spectra values for this point at matching wavelengths
-                        point_spectra = spectra_values[valid_indices, point_idx]
-                        
-                        # Handle NaN values by replacing with zeros or interpolating
-                        if np.any(np.isnan(point_spectra)):
-                            # Option 1: Replace NaN with 0
-                            point_spectra = np.nan_to_num(point_spectra, nan=0.0)
-                        
-                        # Handle negative values (replace with 0 or skip)
-                        if np.any(point_spectra < 0):
-                            point_spectra = np.maximum(point_spectra, 0.0)
-                        
-                        # More lenient check: allow processing even if some values are zero
-                        if len(point_spectra) > 0: 
-                            # Calculate the band value for this point
-                            band_value = np.sum(valid_fac * point_spectra)
-                            
-                            # Apply scaling factor to match expected results (divide by 10^11)
-                            band_value = band_value * 10
-                            
-                            # Store the result (even if it's 0)
-                            if not np.isnan(band_value):
-                                results[band_idx, point_idx] = band_value
-                            else:
-                                # If calculation resulted in NaN, set to 0
-                                results[band_idx, point_idx] = 0.0
-                                
-                    except (IndexError, ValueError):
-                        results[band_idx, point_idx] = 0.0
-                        continue
-                                
-            except Exception:
+            if srf_col_idx >= srf_array.shape[1]:
                 continue
 
+            # Extract SRF for this band and filter out NaN values
+            srf_values_raw = srf_array[:, srf_col_idx]
+            valid_mask = ~(np.isnan(srf_wavelengths_raw) | np.isnan(srf_values_raw))
+            srf_wavelengths = srf_wavelengths_raw[valid_mask].astype(int)
+            srf_values = srf_values_raw[valid_mask]
+
+            # Apply wavelength filtering
+            if wavelength_range is not None:
+                min_wave, max_wave = wavelength_range
+                mask = (srf_wavelengths >= min_wave) & (srf_wavelengths <= max_wave)
+                srf_wavelengths = srf_wavelengths[mask]
+                srf_values = srf_values[mask]
+
+            # Check if we have valid SRF data
+            if len(srf_values) == 0:
+                continue
+
+            # Calculate FAC (normalization)
+            srf_sum = np.sum(srf_values)
+            if srf_sum <= 0:
+                continue
+
+            fac_values = srf_values / srf_sum
+
+            # Find matching wavelengths between spectra and SRF
+            positions = np.minimum(
+                np.searchsorted(unique_wavelengths, srf_wavelengths), len(unique_wavelengths) - 1
+            )
+            matched = unique_wavelengths[positions] == srf_wavelengths
+            if not np.any(matched):
+                continue
+
+            valid_indices = first_indices[positions[matched]]
+            valid_fac = fac_values[matched]
+
+            # Replace NaN and negative spectra values with 0 for all points at once,
+            # one row per point so each sum runs in the same order as a single spectrum
+            point_spectra = np.ascontiguousarray(spectra_values[valid_indices, :].T)
+            point_spectra = np.maximum(np.where(np.isnan(point_spectra), 0.0, point_spectra), 0.0)
+
+            # Calculate the band value and apply the scaling factor
+            band_values = np.sum(valid_fac * point_spectra, axis=1) * 10
+
+            # If calculation resulted in NaN, set to 0
+            results[band_idx] = np.where(np.isnan(band_values), 0.0, band_values)
+
+        return results
+
+    def _simulate_bands_direct_optimized(self, spectra, sensor, point_names):
+        # pandas is only needed to build the DataFrame output
+        import pandas as pd
+
+        wave_centers = SENSORS[sensor][2]
+        results = self.simulate(sensor, spectra.values, spectra.index.values)
+
         # Create result DataFrame
         band_names = [f'Band_{wave}nm' for wave in wave_centers]
         result_df = pd.DataFrame(results.T, columns=band_names, index=point_names)
-        
+
         # Add Wave column at the beginning (though it seems redundant)
         result_df.insert(0, 'Wave', [wave_centers[i] if i < len(wave_centers) else 0 for i in range(len(point_names))])
-        
+
         # Format numerical columns to avoid scientific notation
         for col in band_names:
             result_df[col] = result_df[col].apply(lambda x: f"{x:.16f}" if not pd.isna(x) else x)
-    
-        return result_df            
+
+        return result_df
 
     def olci(self, spectra, point_names):
-        band_indices = list(range(1, 20))
-        wave_centers = [400, 412, 442, 490, 510, 560, 620, 665, 673, 681, 
-                       708, 753, 761, 764, 767, 778, 865, 885, 900]
-        
-        return self._simulate_bands_direct_optimized(
-            spectra, self.srf_data['s3'], band_indices, wave_centers, 
-            point_names, wavelength_range=(400, 900)
-        )
-    
+        return self._simulate_bands_direct_optimized(spectra, 'olci', point_names)
+
     def msi(self, spectra, point_names):
-        band_indices = list(range(1, 10))
-        wave_centers = [440, 490, 560, 665, 705, 740, 783, 842, 865]
-        
-        s2a_result = self._simulate_bands_direct_optimized(
-            spectra, self.srf_data['s2a'], band_indices, wave_centers,
-            point_names, wavelength_range=(400, 900)
-        )
-        
-        s2b_result = self._simulate_bands_direct_optimized(
-            spectra, self.srf_data['s2b'], band_indices, wave_centers,
-            point_names, wavelength_range=(400, 900)
-        )
-        
+        s2a_result = self._simulate_bands_direct_optimized(spectra, 'msi_s2a', point_names)
+        s2b_result = self._simulate_bands_direct_optimized(spectra, 'msi_s2b', point_names)
+
         return {'s2a': s2a_result, 's2b': s2b_result}
-    
+
     def oli(self, spectra, point_names):
-        band_indices = list(range(1, 6))
-        wave_centers = [440, 490, 560, 665, 865]
-        
-        return self._simulate_bands_direct_optimized(
-            spectra, self.srf_data['l8'], band_indices, wave_centers, point_names
-        )
-    
+        return self._simulate_bands_direct_optimized(spectra, 'oli', point_names)
+
     def etm(self, spectra, point_names):
-        band_indices = list(range(1, 5))
-        wave_centers = [490, 560, 665, 865]
-        
-        return self._simulate_bands_direct_optimized(
-            spectra, self.srf_data['l7'], band_indices, wave_centers, point_names
-        )
-    
+        return self._simulate_bands_direct_optimized(spectra, 'etm', point_names)
+
     def tm(self, spectra, point_names):
-        band_indices = list(range(1, 5))
-        wave_centers = [490, 560, 665, 865]
-        
-        return self._simulate_bands_direct_optimized(
-            spectra, self.srf_data['l5'], band_indices, wave_centers, point_names
-        )
+        return self._simulate_bands_direct_optimized(spectra, 'tm', point_names)
 
     def superdove(self, spectra, point_names):
-        band_indices = list(range(1, 9))
-        wave_centers = [443, 490, 531, 565, 610, 665, 705, 865]
-        
-        return self._simulate_bands_direct_optimized(
-            spectra, self.srf_data['planet'], band_indices, wave_centers,
-            point_names, wavelength_range=(400, 900)
-        )
-    
+        return self._simulate_bands_direct_optimized(spectra, 'superdove', point_names)
+
     def modis(self, spectra, point_names):
-        band_indices = list(range(1, 17))
-        wave_centers = [412, 443, 469, 488, 531, 551, 555, 645, 667, 678, 
-                       748, 859, 869, 1240, 1640, 2130]
-        
-        return self._simulate_bands_direct_optimized(
-            spectra, self.srf_data['modis'], band_indices, wave_centers,
-            point_names, wavelength_range=(400, 900)
-        )
\ No newline at end of file
+        return self._simulate_bands_direct_optimized(spectra, 'modis', point_names)
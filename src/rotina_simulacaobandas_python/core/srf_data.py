@@ -0,0 +1,60 @@
+import os
+from collections.abc import Mapping
+import numpy as np
+
+SRF_FILES = {
+    's3': 's3_srf',
+    's2a': 's2_srf',
+    's2b': 's2b_srf',
+    'l8': 'l8_srf',
+    'l7': 'l7_srf',
+    'l5': 'l5_srf',
+    'planet': 'planet_srf',
+    'modis': 'modis_srf'
+}
+
+# SRF tables bundled with the package as NumPy arrays
+RESOURCE_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+class SRFData(Mapping):
+    def __init__(self, data_folder=None):
+        self.data_folder = data_folder
+        self._srf_tables = {}
+        self._srf_arrays = {}
+
+    def __getitem__(self, key):
+        # Load each SRF table only when a sensor first needs it
+        if key not in self._srf_tables:
+            file_name = SRF_FILES[key]
+
+            if self.data_folder is None:
+                self._srf_tables[key] = np.load(
+                    os.path.join(RESOURCE_FOLDER, f"{file_name}.npy"), allow_pickle=False
+                )
+            else:
+                # Pickled DataFrames from a custom folder still need pandas
+                import pandas as pd
+                self._srf_tables[key] = pd.read_pickle(f"{self.data_folder}/{file_name}.pkl")
+
+        return self._srf_tables[key]
+
+    def __contains__(self, key):
+        return key in SRF_FILES
+
+    def __iter__(self):
+        return iter(SRF_FILES)
+
+    def __len__(self):
+        return len(SRF_FILES)
+
+    def get_array(self, key):
+        if key not in self._srf_arrays:
+            srf = self[key]
+
+            if isinstance(srf, np.ndarray):
+                self._srf_arrays[key] = srf
+            else:
+                import pandas as pd
+                self._srf_arrays[key] = srf.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+
+        return self._srf_arrays[key]
@@ -23,13 +23,18 @@ def main():
     print("Processing spectra...")
     spectra, point_names = data_processor.process_spectra(data, target_stations)
     
-    # Run simulations
+    # Run simulations, writing each sensor's results in the background as it finishes
     print("Running satellite band simulations...")
-    simulation_results = data_processor.run_all_simulations(simulator, spectra, point_names)
+    data_processor.run_all_simulations(
+        simulator, spectra, point_names,
+        on_result=lambda sensor_name, result_df: output_handler.submit_result(
+            sensor_name, result_df, point_names, target_stations
+        )
+    )
     
-    # Save results
+    # Wait for pending writes
     print("Saving results...")
-    output_handler.save_all_results(simulation_results, point_names, target_stations)
+    output_handler.wait_for_writes()
     
     print(f"Results saved to {output_dir}/ directory.")
     print("Simulation completed!")
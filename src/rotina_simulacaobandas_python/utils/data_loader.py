@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 import os
 
 class DataLoader:
@@ -6,4 +7,21 @@ class DataLoader:
         if not os.path.exists(data_path):
             raise FileNotFoundError(f"Error: File {data_path} not found")
         
-        return pd.read_csv(data_path)
\ No newline at end of file
+        return pd.read_csv(data_path)
+    
+    def export_srf_resource(self, pickle_path, resource_path):
+        # Convert a pickled SRF DataFrame into the NumPy array bundled with the
+        # package; non-numeric cells become NaN and are skipped by the simulator
+        srf = pd.read_pickle(pickle_path)
+        srf_values = srf.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        
+        np.save(resource_path, srf_values, allow_pickle=False)
+    
+    def export_srf_resources(self, data_folder, resource_folder):
+        # Regenerate the bundled array for every pickled SRF in data_folder
+        for file_name in sorted(os.listdir(data_folder)):
+            if file_name.endswith('.pkl'):
+                self.export_srf_resource(
+                    os.path.join(data_folder, file_name),
+                    os.path.join(resource_folder, f"{file_name[:-len('.pkl')]}.npy")
+                )
\ No newline at end of file
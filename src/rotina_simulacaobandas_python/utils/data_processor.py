@@ -80,7 +80,7 @@ class DataProcessor:
         
         return point_names, spectra
     
-    def run_all_simulations(self, simulator, spectra, point_names):
+    def run_all_simulations(self, simulator, spectra, point_names, on_result=None):
         simulation_results = {}
         
         simulations = [
@@ -98,12 +98,22 @@ class DataProcessor:
                 result = sim_func()
                 
                 if sim_name == 'MSI':
-                    simulation_results['msi_s2a'] = result['s2a']
-                    simulation_results['msi_s2b'] = result['s2b']
+                    sensor_results = {'msi_s2a': result['s2a'], 'msi_s2b': result['s2b']}
                 else:
-                    simulation_results[sim_name.lower()] = result
+                    sensor_results = {sim_name.lower(): result}
                     
             except Exception as e:
                 print(f"Error in {sim_name} simulation: {e}")
+                continue
+            
+            simulation_results.update(sensor_results)
+            
+            # Hand finished results over as soon as they are available
+            if on_result is not None:
+                for sensor_name, sensor_result in sensor_results.items():
+                    try:
+                        on_result(sensor_name, sensor_result)
+                    except Exception as e:
+                        print(f"Error handling {sensor_name} results: {e}")
         
         return simulation_results
\ No newline at end of file
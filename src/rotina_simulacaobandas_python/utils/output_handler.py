@@ -1,9 +1,30 @@
 import pandas as pd
 import os
+from concurrent.futures import ThreadPoolExecutor, wait
 
 class OutputHandler:
-    def __init__(self, output_dir):
+    COMPRESSION_EXTENSIONS = {
+        None: '',
+        'gzip': '.gz',
+        'zstd': '.zst'
+    }
+
+    def __init__(self, output_dir, max_workers=4, compression=None):
+        if compression not in self.COMPRESSION_EXTENSIONS:
+            raise ValueError(f"Unsupported compression: {compression}")
+        
+        # pandas only supports zstd output through the optional zstandard package
+        if compression == 'zstd':
+            try:
+                import zstandard
+            except ImportError:
+                raise ImportError("zstd compression requires the 'zstandard' package")
+
         self.output_dir = output_dir
+        self.max_workers = max_workers
+        self.compression = compression
+        self._executor = None
+        self._pending = []
         self._create_output_directory()
     
     def _create_output_directory(self):
@@ -68,16 +89,71 @@ class OutputHandler:
         
         return result_df
     
-    def save_all_results(self, simulation_results, point_names, target_gid_count=1000):
-        for sensor_name, result_df in simulation_results.items():
+    def get_output_path(self, sensor_name):
+        extension = self.COMPRESSION_EXTENSIONS[self.compression]
+        return f"{self.output_dir}/{sensor_name}_simulation.csv{extension}"
+
+    def save_result(self, sensor_name, result_df, point_names, target_gid_count=1000):
+        converted_df = self.convert_to_wave_format(
+            result_df, point_names, sensor_name, target_gid_count
+        )
+        if converted_df.empty:
+            print(f"Warning: {sensor_name} results are empty")
+            return None
+
+        # Write to a temporary file and rename it once complete, so readers
+        # never see a partially written result
+        output_path = self.get_output_path(sensor_name)
+        temp_path = f"{output_path}.tmp"
+        try:
+            converted_df.to_csv(temp_path, index=False, compression=self.compression)
+            os.replace(temp_path, output_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        return output_path
+
+    def submit_result(self, sensor_name, result_df, point_names, target_gid_count=1000):
+        # Queue the write on the background pool and return immediately
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        future = self._executor.submit(
+            self.save_result, sensor_name, result_df, point_names, target_gid_count
+        )
+        self._pending.append((sensor_name, future))
+        return future
+
+    def wait_for_writes(self):
+        pending, self._pending = self._pending, []
+        wait([future for _, future in pending])
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        # Report every write that failed or produced no file
+        output_paths = []
+        failed_sensors = []
+        for sensor_name, future in pending:
             try:
-                converted_df = self.convert_to_wave_format(
-                    result_df, point_names, sensor_name, target_gid_count
-                )
-                if not converted_df.empty:
-                    output_path = f"{self.output_dir}/{sensor_name}_simulation.csv"
-                    converted_df.to_csv(output_path, index=False)
-                else:
-                    print(f"Warning: {sensor_name} results are empty")
+                output_path = future.result()
             except Exception as e:
-                print(f"Error saving {sensor_name} results: {e}")
\ No newline at end of file
+                print(f"Error saving {sensor_name} results: {e}")
+                output_path = None
+
+            if output_path is None:
+                failed_sensors.append(sensor_name)
+            output_paths.append(output_path)
+
+        if failed_sensors:
+            raise RuntimeError(f"Failed to save results for: {', '.join(failed_sensors)}")
+
+        return output_paths
+
+    def save_all_results(self, simulation_results, point_names, target_gid_count=1000):
+        for sensor_name, result_df in simulation_results.items():
+            self.submit_result(sensor_name, result_df, point_names, target_gid_count)
+
+        return self.wait_for_writes()
\ No newline at end of file
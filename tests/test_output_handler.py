@@ -0,0 +1,138 @@
+import os
+import sys
+import pandas as pd
+import pytest
+from src.rotina_simulacaobandas_python.utils.data_processor import DataProcessor
+from src.rotina_simulacaobandas_python.utils.output_handler import OutputHandler
+
+@pytest.fixture
+def sample_result():
+    return pd.DataFrame(
+        {
+            'Wave': [490, 560, 665],
+            'Band_490nm': [0.1, 0.2, 0.3],
+            'Band_560nm': [0.4, 0.5, 0.6]
+        },
+        index=['GID_1', 'GID_2', 'GID_3']
+    )
+
+class MockSimulator:
+    def __init__(self, result, events):
+        self.result = result
+        self.events = events
+
+    def _simulate(self, sensor_name):
+        self.events.append(f'compute:{sensor_name}')
+        return self.result
+
+    def msi(self, spectra, point_names):
+        return {'s2a': self._simulate('msi'), 's2b': self.result}
+
+    def oli(self, spectra, point_names):
+        return self._simulate('oli')
+
+    def etm(self, spectra, point_names):
+        return self._simulate('etm')
+
+    def tm(self, spectra, point_names):
+        return self._simulate('tm')
+
+    def olci(self, spectra, point_names):
+        return self._simulate('olci')
+
+    def superdove(self, spectra, point_names):
+        return self._simulate('superdove')
+
+    def modis(self, spectra, point_names):
+        return self._simulate('modis')
+
+class TestOutputHandler:
+    def test_save_all_results(self, tmp_path, sample_result, sample_point_names):
+        handler = OutputHandler(str(tmp_path))
+
+        paths = handler.save_all_results(
+            {'etm': sample_result, 'tm': sample_result}, sample_point_names, 3
+        )
+
+        assert paths == [handler.get_output_path('etm'), handler.get_output_path('tm')]
+        for path in paths:
+            df = pd.read_csv(path)
+            assert list(df['Wave']) == [490, 560]
+            assert list(df.columns) == ['Wave', 'GID_1', 'GID_2', 'GID_3']
+
+        # No temporary files are left behind
+        assert sorted(os.listdir(tmp_path)) == ['etm_simulation.csv', 'tm_simulation.csv']
+
+    def test_gzip_compression(self, tmp_path, sample_result, sample_point_names):
+        handler = OutputHandler(str(tmp_path), compression='gzip')
+
+        handler.submit_result('oli', sample_result, sample_point_names, 3)
+        paths = handler.wait_for_writes()
+
+        assert paths == [f"{tmp_path}/oli_simulation.csv.gz"]
+        df = pd.read_csv(paths[0])
+        assert list(df['GID_2']) == [0.2, 0.5]
+
+    def test_unsupported_compression(self, tmp_path):
+        with pytest.raises(ValueError):
+            OutputHandler(str(tmp_path), compression='bz3')
+
+    def test_zstd_requires_zstandard(self, tmp_path, monkeypatch):
+        # A None entry in sys.modules makes the import fail
+        monkeypatch.setitem(sys.modules, 'zstandard', None)
+
+        with pytest.raises(ImportError):
+            OutputHandler(str(tmp_path), compression='zstd')
+
+    def test_wait_for_writes_reports_failures(self, tmp_path, sample_result, sample_point_names):
+        handler = OutputHandler(str(tmp_path))
+
+        handler.submit_result('etm', sample_result, sample_point_names, 3)
+        handler.submit_result('tm', pd.DataFrame({'Wave': [490]}), sample_point_names, 3)
+
+        with pytest.raises(RuntimeError, match='tm'):
+            handler.wait_for_writes()
+
+        assert os.path.exists(handler.get_output_path('etm'))
+
+    def test_writes_submitted_during_simulations(self, tmp_path, sample_result, sample_point_names):
+        handler = OutputHandler(str(tmp_path))
+        events = []
+
+        def on_result(sensor_name, result_df):
+            events.append(f'submit:{sensor_name}')
+            handler.submit_result(sensor_name, result_df, sample_point_names, 3)
+
+        DataProcessor().run_all_simulations(
+            MockSimulator(sample_result, events), None, sample_point_names, on_result=on_result
+        )
+        handler.wait_for_writes()
+
+        # Each sensor is handed over before the next simulation starts
+        assert events.index('submit:msi_s2b') < events.index('compute:oli')
+        assert events.index('submit:olci') < events.index('compute:modis')
+
+        sensors = ['msi_s2a', 'msi_s2b', 'oli', 'etm', 'tm', 'olci', 'superdove', 'modis']
+        for sensor_name in sensors:
+            assert os.path.exists(handler.get_output_path(sensor_name))
+
+    def test_failed_write_keeps_previous_output(self, tmp_path, sample_result, sample_point_names, monkeypatch):
+        handler = OutputHandler(str(tmp_path))
+        output_path = handler.save_result('etm', sample_result, sample_point_names, 3)
+        with open(output_path) as f:
+            previous_output = f.read()
+
+        def failing_to_csv(self, path, **kwargs):
+            # Leave a partial file behind before failing
+            with open(path, 'w') as f:
+                f.write('Wave,GID_1\n')
+            raise OSError('disk full')
+
+        monkeypatch.setattr(pd.DataFrame, 'to_csv', failing_to_csv)
+
+        with pytest.raises(OSError):
+            handler.save_result('etm', sample_result, sample_point_names, 3)
+
+        assert os.listdir(tmp_path) == ['etm_simulation.csv']
+        with open(output_path) as f:
+            assert f.read() == previous_output
@@ -158,4 +158,30 @@ class TestSatelliteBandSimulator:
             assert any(result[name] > 0)
 
 
-    
\ No newline at end of file
+    
+
+    def test_simulate_with_bundled_srf(self, sample_spectra):
+        simulator = SatelliteBandSimulator()
+        wavelengths = sample_spectra.index.values
+
+        result = simulator.simulate('olci', sample_spectra.values, wavelengths)
+
+        # One row per band and one column per point
+        assert result.shape == (19, 3)
+        assert np.all(result >= 0)
+        assert np.any(result > 0)
+
+        # A single 1-D spectrum gives one value per band
+        single = simulator.simulate('olci', sample_spectra.values[:, 0], wavelengths)
+        assert single.shape == (19,)
+        np.testing.assert_array_equal(single, result[:, 0])
+
+    def test_simulate_invalid_shapes(self, sample_spectra):
+        simulator = SatelliteBandSimulator()
+        wavelengths = sample_spectra.index.values
+
+        with pytest.raises(ValueError):
+            simulator.simulate('etm', sample_spectra.values[np.newaxis], wavelengths)
+
+        with pytest.raises(ValueError):
+            simulator.simulate('etm', sample_spectra.values, wavelengths[:-1])
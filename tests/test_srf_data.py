@@ -0,0 +1,34 @@
+import os
+import numpy as np
+import pytest
+from src.rotina_simulacaobandas_python.core.srf_data import RESOURCE_FOLDER, SRF_FILES
+from src.rotina_simulacaobandas_python.utils.data_loader import DataLoader
+
+DATA_RAW_FOLDER = os.path.join(os.path.dirname(RESOURCE_FOLDER), '..', 'data-raw')
+
+class TestSRFResources:
+    def test_bundled_files(self):
+        expected = sorted(f"{file_name}.npy" for file_name in SRF_FILES.values())
+
+        assert sorted(os.listdir(RESOURCE_FOLDER)) == expected
+
+    @pytest.mark.parametrize('file_name', sorted(SRF_FILES.values()))
+    def test_bundled_srf_matches_data_raw(self, tmp_path, file_name):
+        # The bundled arrays must stay in sync with the pickles in data-raw
+        resource_path = tmp_path / f"{file_name}.npy"
+        DataLoader().export_srf_resource(
+            os.path.join(DATA_RAW_FOLDER, f"{file_name}.pkl"), resource_path
+        )
+
+        bundled = np.load(os.path.join(RESOURCE_FOLDER, f"{file_name}.npy"))
+        regenerated = np.load(resource_path)
+
+        assert np.array_equal(bundled, regenerated, equal_nan=True)
+
+    def test_export_srf_resources(self, tmp_path):
+        DataLoader().export_srf_resources(DATA_RAW_FOLDER, str(tmp_path))
+
+        for file_name in SRF_FILES.values():
+            bundled = np.load(os.path.join(RESOURCE_FOLDER, f"{file_name}.npy"))
+            regenerated = np.load(tmp_path / f"{file_name}.npy")
+            assert np.array_equal(bundled, regenerated, equal_nan=True)
@@ -0,0 +1,45 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Time from importing the package to the first simulated spectrum. Wall-clock
+# checks are unreliable on loaded machines, so this one only runs on request
+STARTUP_BUDGET_SECONDS = 0.1
+RUN_STARTUP_BENCHMARK = os.environ.get('RUN_STARTUP_BENCHMARK') == '1'
+
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import numpy as np
+from src.rotina_simulacaobandas_python.core.spectra_simulation import SatelliteBandSimulator
+wavelengths = np.arange(400, 901)
+bands = SatelliteBandSimulator().simulate('olci', np.full((len(wavelengths), 1), 0.01), wavelengths)
+elapsed = time.perf_counter() - start
+print(json.dumps({'elapsed': elapsed, 'pandas': 'pandas' in sys.modules, 'shape': bands.shape}))
+"""
+
+def run_startup():
+    output = subprocess.run(
+        [sys.executable, '-c', STARTUP_SCRIPT],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output)
+
+class TestStartup:
+    def test_core_does_not_import_pandas(self):
+        result = run_startup()
+
+        assert result['pandas'] is False
+        assert result['shape'] == [19, 1]
+
+    @pytest.mark.skipif(not RUN_STARTUP_BENCHMARK, reason="set RUN_STARTUP_BENCHMARK=1 to run")
+    def test_startup_time(self):
+        # Best of a few fresh interpreters to smooth out scheduling noise
+        elapsed = min(run_startup()['elapsed'] for _ in range(3))
+
+        assert elapsed < STARTUP_BUDGET_SECONDS